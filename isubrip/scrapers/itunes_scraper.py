@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+from collections import ChainMap
 import re
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, ClassVar, Iterator
 
-import m3u8
 from requests.exceptions import HTTPError
 
 from isubrip.data_structures import SubtitlesData, SubtitlesFormatType
 from isubrip.logger import logger
 from isubrip.scrapers.scraper import HLSScraper, PlaylistLoadError, ScraperError, ScraperFactory, SubtitlesDownloadError
 from isubrip.subtitle_formats.webvtt import WebVTTSubtitles
-from isubrip.utils import merge_dict_values, raise_for_status
+from isubrip.utils import raise_for_status
 
 if TYPE_CHECKING:
+    from m3u8 import Media
+
     from isubrip.data_structures import Movie, ScrapedMediaResponse
 
 
@@ -22,7 +25,7 @@ class ItunesScraper(HLSScraper):
     name = "iTunes"
     abbreviation = "iT"
     url_regex = re.compile(r"(?i)(?P<base_url>https?://itunes\.apple\.com/(?:(?P<country_code>[a-z]{2})/)?(?P<media_type>movie|tv-show|tv-season|show)/(?:(?P<media_name>[\w\-%]+)/)?(?P<media_id>id\d{9,10}))(?:\?(?P<url_params>.*))?")
-    subtitles_class = WebVTTSubtitles
+    subtitles_class: ClassVar[type[WebVTTSubtitles]] = WebVTTSubtitles
     is_movie_scraper = True
     uses_scrapers = ["appletv"]
 
@@ -39,6 +42,7 @@ class ItunesScraper(HLSScraper):
             extract_scraper_config=True,
             raise_error=True,
         )
+        self._redirect_locations_cache: dict[str, str] = {}
 
     def get_data(self, url: str) -> ScrapedMediaResponse[Movie]:
         """
@@ -58,6 +62,11 @@ class ItunesScraper(HLSScraper):
         """
         regex_match = self.match_url(url, raise_error=True)
         url = regex_match.group(1)
+
+        if cached_redirect_location := self._redirect_locations_cache.get(url):
+            logger.debug(f"Using cached Apple TV redirect URL for iTunes URL '{url}': '{cached_redirect_location}'.")
+            return self._appletv_scraper.get_data(cached_redirect_location)
+
         logger.debug(f"Scraping iTunes URL: {url}.")
         response = self._session.get(url=url, allow_redirects=False)
 
@@ -85,8 +94,54 @@ class ItunesScraper(HLSScraper):
             logger.debug(f"iTunes URL: {url} redirected to an invalid Apple TV URL: '{redirect_location}'.")
             raise ScraperError("Redirect URL is not a valid Apple TV URL.")
 
+        self._redirect_locations_cache[url] = redirect_location
+
         return self._appletv_scraper.get_data(redirect_location)
 
+    async def _download_subtitles_async(self, media: Media) -> WebVTTSubtitles:
+        """
+        Download subtitles of an M3U8 Media object asynchronously.
+        All segments are downloaded concurrently, and each segment is parsed (in order) as soon as it's available,
+        while the remaining segments are still being downloaded.
+
+        Args:
+            media (m3u8.Media): Subtitles Media object to download.
+
+        Raises:
+            PlaylistLoadError: No segments were found in the subtitles playlist.
+
+        Returns:
+            WebVTTSubtitles: The downloaded subtitles.
+        """
+        segment_uris = await self._get_media_segment_uris_async(media=media)
+
+        if not segment_uris:
+            raise PlaylistLoadError("No segments found in subtitles playlist.")
+
+        download_tasks = [asyncio.ensure_future(self._download_segment_async(url=segment_uri))
+                          for segment_uri in segment_uris]
+        subtitles = self.subtitles_class(data=None, language_code=media.language)
+        # Read settings once, instead of looking up class attributes for every segment
+        fix_rtl, remove_duplicates = self.subtitles_fix_rtl, self.subtitles_remove_duplicates
+
+        try:
+            for segment_index, download_task in enumerate(download_tasks):
+                subtitles.extend_parsed(
+                    data=await download_task,
+                    skip_head=(segment_index > 0),
+                    fix_rtl=fix_rtl,
+                    remove_duplicates=remove_duplicates,
+                )
+
+        finally:
+            # Stop remaining downloads if an error occurred
+            for download_task in download_tasks:
+                download_task.cancel()
+
+            await asyncio.gather(*download_tasks, return_exceptions=True)
+
+        return subtitles
+
     def get_subtitles(self, main_playlist: str | list[str], language_filter: list[str] | str | None = None,
                       subrip_conversion: bool = False) -> Iterator[SubtitlesData | SubtitlesDownloadError]:
         language_filters = {self.M3U8Attribute.LANGUAGE.value: language_filter} if language_filter else None
@@ -95,58 +150,57 @@ class ItunesScraper(HLSScraper):
         if main_playlist_m3u8 is None:
             raise PlaylistLoadError("Could not load M3U8 playlist.")
 
-        playlist_filters = (merge_dict_values(self._subtitles_filters, language_filters)
+        # Language filters don't overlap with subtitles filters, so a (non-copying) ChainMap can be used
+        playlist_filters = (ChainMap(language_filters, self._subtitles_filters)
                             if language_filters
                             else self._subtitles_filters)
 
         matched_media_items = self.get_media_playlists(main_playlist=main_playlist_m3u8,
                                                        playlist_filters=playlist_filters)
 
-        for matched_media in matched_media_items:
-            language_name = matched_media.name.replace(' (forced)', '').strip()
-            language_code = matched_media.language
-            special_type = self.detect_subtitles_type(subtitles_media=matched_media)
-
-            try:
-                m3u8_data = self._session.get(url=matched_media.absolute_uri)
-                matched_media_playlist = m3u8.loads(content=m3u8_data.text, uri=matched_media.absolute_uri)
-
-                subtitles_segments = self._download_segments(matched_media_playlist.segments)
-                subtitles = self.subtitles_class(data=subtitles_segments[0], language_code=language_code)
-
-                for segment in subtitles_segments[1:]:
-                    segment_subtitles_obj = self.subtitles_class(data=segment, language_code=language_code)
-                    segment_subtitles_obj.remove_head_blocks()
-                    subtitles.append_subtitles(segment_subtitles_obj)
-
-                subtitles.polish(
-                    fix_rtl=self.subtitles_fix_rtl,
-                    remove_duplicates=self.subtitles_remove_duplicates,
-                )
+        subtitles_format = SubtitlesFormatType.SUBRIP if subrip_conversion else SubtitlesFormatType.WEBVTT
+        loop = self._event_loop
+        # Start downloading all matched subtitles concurrently, and process them (in order) once they're ready
+        download_tasks = [loop.create_task(self._download_subtitles_async(media=matched_media))
+                          for matched_media in matched_media_items]
 
+        try:
+            for matched_media, download_task in zip(matched_media_items, download_tasks):
                 language_name = matched_media.name.replace(' (forced)', '').strip()
-
-                if subrip_conversion:
-                    subtitles_format = SubtitlesFormatType.SUBRIP
-                    content = subtitles.to_srt().dump()
-
-                else:
-                    subtitles_format = SubtitlesFormatType.WEBVTT
-                    content = subtitles.dump()
-
-                yield SubtitlesData(
-                    language_code=language_code,
-                    language_name=language_name,
-                    subtitles_format=subtitles_format,
-                    content=content,
-                    content_encoding=subtitles.encoding,
-                    special_type=special_type,
-                )
-
-            except Exception as e:
-                yield SubtitlesDownloadError(
-                    language_code=language_code,
-                    language_name=language_name,
-                    special_type=special_type,
-                    original_exc=e,
-                )
+                language_code = matched_media.language
+                special_type = self.detect_subtitles_type(subtitles_media=matched_media)
+
+                try:
+                    subtitles = loop.run_until_complete(download_task)
+                    content = subtitles.to_srt().dump() if subrip_conversion else subtitles.dump()
+
+                    yield SubtitlesData(
+                        language_code=language_code,
+                        language_name=language_name,
+                        subtitles_format=subtitles_format,
+                        content=content,
+                        content_encoding=subtitles.encoding,
+                        special_type=special_type,
+                    )
+
+                except Exception as e:
+                    yield SubtitlesDownloadError(
+                        language_code=language_code,
+                        language_name=language_name,
+                        special_type=special_type,
+                        original_exc=e,
+                    )
+
+        finally:
+            # The loop might already be closed (and its tasks cancelled) if the scraper was closed first
+            if not loop.is_closed():
+                for task in download_tasks:
+                    task.cancel()
+
+                if download_tasks:
+                    loop.run_until_complete(asyncio.gather(*download_tasks, return_exceptions=True))
+
+            # Retrieve exceptions of finished tasks that weren't consumed, to avoid "never retrieved" errors
+            for task in download_tasks:
+                if task.done() and not task.cancelled():
+                    task.exception()
@@ -6,15 +6,30 @@ from enum import Enum
 import importlib
 import inspect
 from pathlib import Path
-import re
 import sys
-from typing import TYPE_CHECKING, Any, ClassVar, Iterator, List, Literal, Type, TypeVar, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+from urllib.parse import urljoin
 
 import httpx
 import m3u8
-from m3u8 import M3U8, Media, Segment, SegmentList
+from m3u8 import M3U8, Media
 import requests
+from requests.adapters import HTTPAdapter
 import requests.utils
+from urllib3.util.retry import Retry
 
 from isubrip.config import Config, ConfigSetting
 from isubrip.constants import PACKAGE_NAME, SCRAPER_MODULES_SUFFIX
@@ -23,6 +38,7 @@ from isubrip.logger import logger
 from isubrip.utils import SingletonMeta, merge_dict_values, single_to_list
 
 if TYPE_CHECKING:
+    import re
     from types import TracebackType
 
     from isubrip.subtitle_formats.subtitles import Subtitles
@@ -74,6 +90,14 @@ class Scraper(ABC, metaclass=SingletonMeta):
     is_series_scraper: ClassVar[bool] = False
     uses_scrapers: ClassVar[list[str]] = []
 
+    _url_matchers: ClassVar[tuple[Callable[[str], re.Match | None], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Bind the 'fullmatch' methods of the URL patterns once, instead of looking them up on every 'match_url' call
+        if (url_regex := getattr(cls, "url_regex", None)) is not None:
+            cls._url_matchers = tuple(pattern.fullmatch for pattern in single_to_list(url_regex))
+
     def __init__(self, user_agent: str | None = None, proxy: str | None = None,
                  verify_ssl: bool | None = None, config_data: dict | None = None):
         """
@@ -86,6 +110,20 @@ class Scraper(ABC, metaclass=SingletonMeta):
             config_data (dict | None, optional): A dictionary containing scraper's configuration data. Defaults to None.
         """
         self._session = requests.Session()
+        # Use a larger connection pool (to reuse connections), and retry failed requests on transient errors
+        session_adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", session_adapter)
+        self._session.mount("https://", session_adapter)
+
         self.config = Config(config_data=config_data.get(self.id) if config_data else None)
 
         # Add a "user-agent" setting by default to all scrapers
@@ -187,13 +225,9 @@ class Scraper(ABC, metaclass=SingletonMeta):
         Raises:
             ValueError: If the URL doesn't match the regex and raise_error is True.
         """
-        if isinstance(cls.url_regex, re.Pattern) and (match_result := re.fullmatch(pattern=cls.url_regex, string=url)):
-            return match_result
-
-        if isinstance(cls.url_regex, list):
-            for url_regex_item in cls.url_regex:
-                if result := re.fullmatch(pattern=url_regex_item, string=url):
-                    return result
+        for url_matcher in cls._url_matchers:
+            if match_result := url_matcher(url):
+                return match_result
 
         if raise_error:
             raise ValueError(f"URL '{url}' doesn't match the URL regex of {cls.name}.")
@@ -241,22 +275,66 @@ class Scraper(ABC, metaclass=SingletonMeta):
 
 
 class AsyncScraper(Scraper, ABC):
-    """A base class for scrapers that utilize async requests."""
+    """
+    A base class for scrapers that utilize async requests.
+
+    Attributes:
+        max_concurrent_requests (int): [Class Attribute] Maximum number of async requests to run concurrently.
+        _async_session (httpx.AsyncClient): An async HTTP client to use for making async requests.
+        _event_loop (asyncio.AbstractEventLoop): An event loop owned by the scraper, used to run async requests.
+    """
+    max_concurrent_requests: ClassVar[int] = 20
+
     def __init__(self,  user_agent: str | None = None, config_data: dict | None = None):
         super().__init__(user_agent=user_agent, config_data=config_data)
+        # A dedicated event loop is used (instead of relying on an implicit, deprecated, `get_event_loop` call),
+        # as the async client and the tasks created by the scraper have to run on the same loop.
+        self._event_loop = asyncio.new_event_loop()
+        # HTTP/2 is used to multiplex concurrent requests (like segment downloads) over a single connection
         self._async_session = httpx.AsyncClient(
             headers={"User-Agent": self._user_agent},
             proxy=(httpx.Proxy(url=self._proxy) if self._proxy else None),
             verify=self._verify_ssl,
+            http2=True,
         )
+        self._async_requests_semaphore: asyncio.Semaphore | None = None
 
     def close(self) -> None:
-        asyncio.get_event_loop().run_until_complete(self._async_session.aclose())
+        if not self._event_loop.is_closed():
+            # Cancel (and wait for) any tasks still running on the loop, before closing it
+            pending_tasks = asyncio.all_tasks(self._event_loop)
+
+            for task in pending_tasks:
+                task.cancel()
+
+            if pending_tasks:
+                self._event_loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+
+            self._event_loop.run_until_complete(self._async_session.aclose())
+            self._event_loop.close()
+
         super().close()
 
     async def _async_close(self) -> None:
         await self._async_session.aclose()
 
+    async def _async_get(self, url: str) -> httpx.Response:
+        """
+        Send an async GET request, while limiting the number of concurrent requests to `max_concurrent_requests`.
+
+        Args:
+            url (str): URL to send the request to.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        # Created lazily, so that it's bound to the scraper's event loop (required on Python < 3.10)
+        if self._async_requests_semaphore is None:
+            self._async_requests_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async with self._async_requests_semaphore:
+            return await self._async_session.get(url)
+
 
 class HLSScraper(AsyncScraper, ABC):
     """A base class for HLS (m3u8) scrapers."""
@@ -280,6 +358,13 @@ class HLSScraper(AsyncScraper, ABC):
         TYPE = "type"
 
     _playlist_filters_config_category = "playlist-filters"
+    # Maps (is forced, is closed captions) flags to a subtitles type. Forced takes precedence over CC.
+    _subtitles_types_mapping: ClassVar[dict[tuple[bool, bool], SubtitlesType | None]] = {
+        (True, True): SubtitlesType.FORCED,
+        (True, False): SubtitlesType.FORCED,
+        (False, True): SubtitlesType.CC,
+        (False, False): None,
+    }
     _subtitles_filters: dict[str, Any] = {
         M3U8Attribute.TYPE.value: "SUBTITLES",
     }
@@ -297,34 +382,64 @@ class HLSScraper(AsyncScraper, ABC):
             ) for m3u8_attribute in self.M3U8Attribute],
             check_config=False)
 
-    def _download_segments(self, segments: SegmentList[Segment]) -> list[bytes]:
+    @staticmethod
+    def _decode_m3u8_data(data: bytes) -> str:
         """
-        Download M3U8 segments asynchronously.
+        Decode raw M3U8 playlist data.
+
+        M3U8 playlists are always UTF-8 encoded (RFC 8216, section 4.1), so the data is decoded directly,
+        instead of using `Response.text`, which might run (slow) charset detection on the whole response body.
+        Invalid bytes are replaced (like `Response.text` does), instead of failing the whole playlist.
 
         Args:
-            segments (m3u8.SegmentList[m3u8.Segment]): List of segments to download.
+            data (bytes): Raw M3U8 playlist data.
 
         Returns:
-            list[bytes]: List of downloaded segments.
+            str: Decoded M3U8 playlist data.
         """
-        return asyncio.get_event_loop().run_until_complete(self._download_segments_async(segments))
+        return data.decode("utf-8-sig", errors="replace")
 
-    async def _download_segments_async(self, segments: SegmentList[Segment]) -> list[bytes]:
+    @staticmethod
+    def _extract_segment_uris(playlist_data: str, base_uri: str) -> list[str]:
         """
-        Download M3U8 segments asynchronously.
+        Extract absolute URIs of all segments in an M3U8 media playlist.
+        Much faster than parsing the whole playlist using `m3u8.loads`, as tags (other than URIs) are not parsed.
+        Similarly to `m3u8`, only URI lines that follow an `#EXTINF` tag are treated as segment URIs.
 
         Args:
-            segments (m3u8.SegmentList[m3u8.Segment]): List of segments to download.
+            playlist_data (str): Contents of the M3U8 media playlist.
+            base_uri (str): URI of the playlist, used for resolving relative segment URIs.
 
         Returns:
-            list[bytes]: List of downloaded segments.
+            list[str]: A list of absolute URIs of the playlist's segments (in order).
         """
-        async_tasks = [
-            self._download_segment_async(url=segment.absolute_uri)
-            for segment in segments
-        ]
+        segment_uris = []
+        # Resolve the playlist's "directory" once, so that plain relative URIs (which is what's commonly used)
+        # can be resolved using concatenation, instead of a full `urljoin` for every segment.
+        base_directory_uri = urljoin(base_uri, ".")
+        expect_segment_uri = False
+
+        for line in playlist_data.splitlines():
+            line = line.strip()
 
-        return await asyncio.gather(*async_tasks)
+            if line.startswith("#EXTINF"):
+                expect_segment_uri = True
+                continue
+
+            # Skip empty lines, tags, comments, and lines that aren't segment URIs
+            if not line or line.startswith("#") or not expect_segment_uri:
+                continue
+
+            expect_segment_uri = False
+
+            # Absolute URIs, absolute paths, and paths with dot-segments require a full resolution
+            if ":" in line or "/." in line or line.startswith(("/", ".", "?")):
+                segment_uris.append(urljoin(base_uri, line))
+
+            else:
+                segment_uris.append(base_directory_uri + line)
+
+        return segment_uris
 
     async def _download_segment_async(self, url: str) -> bytes:
         """
@@ -336,9 +451,33 @@ class HLSScraper(AsyncScraper, ABC):
         Returns:
             bytes: Downloaded segment.
         """
-        response = await self._async_session.get(url)
+        response = await self._async_get(url)
+        response.raise_for_status()
         return response.content
 
+    async def _get_media_segment_uris_async(self, media: Media) -> list[str]:
+        """
+        Download the playlist of an M3U8 Media object asynchronously, and extract its segments URIs.
+
+        Args:
+            media (m3u8.Media): Media object of the playlist to download.
+
+        Raises:
+            httpx.HTTPStatusError: The playlist request returned an error status code.
+            PlaylistLoadError: The response is not a valid M3U8 playlist.
+
+        Returns:
+            list[str]: A list of absolute URIs of the playlist's segments (in order).
+        """
+        response = await self._async_get(media.absolute_uri)
+        response.raise_for_status()
+        playlist_data = self._decode_m3u8_data(response.content)
+
+        if not playlist_data.lstrip().startswith("#EXTM3U"):
+            raise PlaylistLoadError(f"Invalid M3U8 playlist received from '{media.absolute_uri}'.")
+
+        return self._extract_segment_uris(playlist_data=playlist_data, base_uri=media.absolute_uri)
+
     def load_m3u8(self, url: str | list[str], headers: dict | None = None) -> M3U8 | None:
         """
         Load an M3U8 playlist from a URL to an M3U8 object.
@@ -363,10 +502,10 @@ class HLSScraper(AsyncScraper, ABC):
                 logger.debug(f"Failed to load M3U8 playlist '{url_item}': {e}")
                 continue
 
-            if not response.text:
+            if not response.content:
                 raise PlaylistLoadError("Received empty response for playlist from server.")
 
-            return m3u8.loads(content=response.text, uri=url_item)
+            return m3u8.loads(content=self._decode_m3u8_data(response.content), uri=url_item)
 
         return None
 
@@ -381,56 +520,57 @@ class HLSScraper(AsyncScraper, ABC):
         Returns:
             SubtitlesType | None: The type of the subtitles, None for regular subtitles.
         """
-        if subtitles_media.forced == "YES":
-            return SubtitlesType.FORCED
+        is_forced = subtitles_media.forced == "YES"
+        is_cc = "public.accessibility" in (subtitles_media.characteristics or "")
 
-        if subtitles_media.characteristics is not None and "public.accessibility" in subtitles_media.characteristics:
-            return SubtitlesType.CC
-
-        return None
+        return HLSScraper._subtitles_types_mapping[(is_forced, is_cc)]
 
     def get_media_playlists(self, main_playlist: M3U8,
-                            playlist_filters: dict[str, str | list[str]] | None = None) -> list[Media]:
+                            playlist_filters: Mapping[str, str | list[str]] | None = None) -> list[Media]:
         """
         Find and yield playlists of media within an M3U8 main_playlist using optional filters.
 
         Args:
             main_playlist (m3u8.M3U8): An M3U8 object of the main main_playlist.
-            playlist_filters (dict[str, str | list[str], optional):
-                A dictionary of filters to use when searching for subtitles.
+            playlist_filters (Mapping[str, str | list[str], optional):
+                A mapping of filters to use when searching for subtitles.
                 Will be added to filters set by the config. Defaults to None.
 
         Returns:
             list[Media]: A list of  matching Media objects.
         """
-        results = []
         config_filters: dict | None = self.config.get(self._playlist_filters_config_category)
         # Merge filtering dictionaries to a single dictionary
         playlist_filters = merge_dict_values(*[item for item in (playlist_filters, config_filters) if item])
 
-        for media in main_playlist.media:
-            if not playlist_filters:
-                results.append(media)
-                continue
+        if not playlist_filters:
+            return list(main_playlist.media)
 
+        # Normalize filters once (instead of for every media item) to (attribute name, casefolded values) pairs
+        normalized_filters: list[tuple[str, set[str]]] = []
+
+        for filter_name, filter_value in playlist_filters.items():
+            try:
+                filter_name_enum = HLSScraper.M3U8Attribute(filter_name)
+                filter_values = {value.casefold() for value in single_to_list(filter_value)}
+
+            except Exception:
+                # An invalid filter can't be matched by any media
+                return []
+
+            normalized_filters.append((filter_name_enum.name.lower(), filter_values))
+
+        results = []
+
+        for media in main_playlist.media:
             is_valid = True
 
-            for filter_name, filter_value in playlist_filters.items():
-                try:
-                    filter_name_enum = HLSScraper.M3U8Attribute(filter_name)
-                    attribute_value = getattr(media, filter_name_enum.name.lower(), None)
-
-                    if (attribute_value is None) or (
-                            isinstance(filter_value, list) and
-                            attribute_value.casefold() not in (x.casefold() for x in filter_value)
-                    ) or (
-                            isinstance(filter_value, str) and filter_value.casefold() != attribute_value.casefold()
-                    ):
-                        is_valid = False
-                        break
-
-                except Exception:
+            for attribute_name, filter_values in normalized_filters:
+                attribute_value = getattr(media, attribute_name, None)
+
+                if not isinstance(attribute_value, str) or attribute_value.casefold() not in filter_values:
                     is_valid = False
+                    break
 
             if is_valid:
                 results.append(media)
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from isubrip.subtitle_formats.subrip import SubRipCaptionBlock, SubRipSubtitles
 
 RTL_CONTROL_CHARS = ('\u200e', '\u200f', '\u202a', '\u202b', '\u202c', '\u202d', '\u202e')
+RTL_CONTROL_CHARS_REMOVAL_TABLE = str.maketrans('', '', ''.join(RTL_CONTROL_CHARS))
 RTL_CHAR = '\u202b'
 RTL_LANGUAGES = ["ar", "he", "he-il"]
 
@@ -67,8 +68,7 @@ class SubtitlesCaptionBlock(SubtitlesBlock, ABC):
         previous_payload = self.payload
 
         # Remove previous RTL-related formatting
-        for char in RTL_CONTROL_CHARS:
-            self.payload = self.payload.replace(char, '')
+        self.payload = self.payload.translate(RTL_CONTROL_CHARS_REMOVAL_TABLE)
 
         # Add RLM char at the start of every line
         self.payload = RTL_CHAR + self.payload.replace("\n", f"\n{RTL_CHAR}")
@@ -263,6 +263,30 @@ class Subtitles(Generic[SubtitlesBlockT], ABC):
 
         return self
 
+    def _append_polished_block(self, block: SubtitlesBlockT, fix_rtl: bool = False,
+                               remove_duplicates: bool = True) -> bool:
+        """
+        Polish a block (see `polish`), and append it to the subtitles.
+        A block that is a duplicate of the last block replaces it, instead of being appended.
+
+        Args:
+            block (SubtitlesBlock): A block to polish and append.
+            fix_rtl (bool, optional): Whether to fix text direction of the block. Defaults to False.
+            remove_duplicates (bool, optional): Whether to remove the block if it's a duplicate. Defaults to True.
+
+        Returns:
+            bool: True if the block is a duplicate that replaced the last block, False otherwise.
+        """
+        if fix_rtl and isinstance(block, SubtitlesCaptionBlock):
+            block.fix_rtl()
+
+        if remove_duplicates and self.blocks and block == self.blocks[-1]:
+            self.blocks[-1] = block
+            return True
+
+        self.blocks.append(block)
+        return False
+
     def polish(self: SubtitlesT,
                fix_rtl: bool = False,
                remove_duplicates: bool = True,
@@ -285,18 +309,14 @@ class Subtitles(Generic[SubtitlesBlockT], ABC):
         )):
             return self
 
-        previous_block: SubtitlesBlockT | None = None
+        # Blocks are re-appended to a new list, instead of removing duplicates from the current one,
+        # which would require a linear search (and shifting of all following blocks) for every removal.
+        original_blocks, self.blocks = self.blocks, []
 
-        for block in self.blocks:
-            if fix_rtl:
-                block.fix_rtl()
-
-            if remove_duplicates and previous_block is not None and block == previous_block:
-                self.blocks.remove(previous_block)
+        for block in original_blocks:
+            if self._append_polished_block(block=block, fix_rtl=fix_rtl, remove_duplicates=remove_duplicates):
                 self._modified = True
 
-            previous_block = block
-
         return self
 
     def modified(self) -> bool:
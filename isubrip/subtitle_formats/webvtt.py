@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from abc import ABCMeta
+from itertools import chain
 import re
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator
 
 from isubrip.data_structures import SubtitlesFormatType
 from isubrip.subtitle_formats.subrip import SubRipCaptionBlock
-from isubrip.subtitle_formats.subtitles import RTL_CHAR, Subtitles, SubtitlesBlock, SubtitlesCaptionBlock
+from isubrip.subtitle_formats.subtitles import RTL_CHAR, RTL_LANGUAGES, Subtitles, SubtitlesBlock, SubtitlesCaptionBlock
 from isubrip.utils import split_subtitles_timestamp
 
 if TYPE_CHECKING:
@@ -176,12 +177,36 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
         Args:
             data (bytes): Subtitles data to load.
         """
+        self.blocks.extend(self._parse_blocks(data=data))
+
+    @staticmethod
+    def _parse_blocks(data: str, skip_head: bool = False) -> Iterator[WebVTTBlock]:
+        """
+        Parse WebVTT subtitles data from a string, and yield its blocks.
+
+        Args:
+            data (str): Subtitles data to parse.
+            skip_head (bool, optional): Whether to skip head blocks (see `remove_head_blocks`)
+                without parsing them. Defaults to False.
+
+        Yields:
+            WebVTTBlock: Parsed WebVTT blocks (in order).
+        """
         prev_line: str = ""
-        lines_iterator = iter(data.splitlines())
+        lines_iterator: Iterator[str] = iter(data.splitlines())
+
+        if skip_head:
+            # Skip lines up to the first caption's timings line, which is then parsed by the loop below
+            for line in lines_iterator:
+                if WEBVTT_CAPTION_BLOCK_REGEX.match(line):
+                    lines_iterator = chain((line,), lines_iterator)
+                    break
+
+                prev_line = line
 
         for line in lines_iterator:
             # If the line is a timestamp
-            if caption_block_regex := re.match(WEBVTT_CAPTION_BLOCK_REGEX, line):
+            if caption_block_regex := WEBVTT_CAPTION_BLOCK_REGEX.match(line):
                 # If previous line wasn't empty, add it as an identifier
                 if prev_line:
                     caption_identifier = prev_line
@@ -201,14 +226,14 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
                     caption_payload += additional_line + "\n"
 
                 caption_payload = caption_payload.rstrip("\n")
-                self.blocks.append(Caption(
+                yield Caption(
                     identifier=caption_identifier,
                     start_time=caption_timestamps[0],
                     end_time=caption_timestamps[1],
                     settings=caption_settings,
-                    payload=caption_payload))
+                    payload=caption_payload)
 
-            elif comment_block_regex := re.match(WEBVTT_COMMENT_HEADER_REGEX, line):
+            elif comment_block_regex := WEBVTT_COMMENT_HEADER_REGEX.match(line):
                 comment_payload = ""
                 inline = False
 
@@ -223,7 +248,7 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
 
                     comment_payload += additional_line + "\n"
 
-                self.blocks.append(Comment(comment_payload.rstrip("\n"), inline=inline))
+                yield Comment(comment_payload.rstrip("\n"), inline=inline)
 
             elif line.rstrip(' \t') == Region.header:
                 region_payload = ""
@@ -235,7 +260,7 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
 
                     region_payload += additional_line + "\n"
 
-                self.blocks.append(Region(region_payload.rstrip("\n")))
+                yield Region(region_payload.rstrip("\n"))
 
             elif line.rstrip(' \t') == Style.header:
                 style_payload = ""
@@ -247,10 +272,46 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
 
                     style_payload += additional_line + "\n"
 
-                self.blocks.append(Style(style_payload.rstrip("\n")))
+                yield Style(style_payload.rstrip("\n"))
 
             prev_line = line
 
+    def extend_parsed(self, data: bytes, skip_head: bool = True, fix_rtl: bool = False,
+                      remove_duplicates: bool = True) -> WebVTTSubtitles:
+        """
+        Parse WebVTT subtitles data, and append its blocks to current subtitles.
+        Blocks are polished (see `polish`) while being appended, in a single pass.
+
+        If the subtitles are empty, and the data is loaded as-is (head blocks are kept, and no duplicates are removed),
+        the data is kept as the subtitles' raw data, so that it's returned by `dump` unless modified afterwards.
+
+        Args:
+            data (bytes): Subtitles data to parse and append.
+            skip_head (bool, optional): Whether to skip head blocks (see `remove_head_blocks`). Defaults to True.
+            fix_rtl (bool, optional): Whether to fix text direction of RTL languages. Defaults to False.
+            remove_duplicates (bool, optional): Whether to remove duplicate captions. Defaults to True.
+
+        Returns:
+            WebVTTSubtitles: The current subtitles object.
+        """
+        fix_rtl = (fix_rtl and self.language_code in RTL_LANGUAGES)
+        is_initial_data = not self.blocks and self.raw_data is None
+        blocks_count = len(self.blocks)
+        duplicates_found = False
+
+        for block in self._parse_blocks(data=data.decode(encoding=self.encoding), skip_head=skip_head):
+            if self._append_polished_block(block=block, fix_rtl=fix_rtl, remove_duplicates=remove_duplicates):
+                duplicates_found = True
+
+        # RTL fixes are tracked by the blocks themselves (see `modified`)
+        if is_initial_data and not skip_head and not duplicates_found:
+            self.raw_data = data
+
+        elif duplicates_found or len(self.blocks) != blocks_count:
+            self._modified = True
+
+        return self
+
     def remove_head_blocks(self) -> None:
         """
         Remove all head blocks (Style / Region) from the subtitles.
@@ -259,12 +320,17 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
             Comment blocks are removed as well if they are before the first caption block (since they're probably
             related to the head blocks).
         """
-        for block in self.blocks:
-            if isinstance(block, Caption):
-                break
-
-            if isinstance(block, (Comment, Style, Region)):
-                self.blocks.remove(block)
+        first_caption_index = next(
+            (index for index, block in enumerate(self.blocks) if isinstance(block, Caption)),
+            len(self.blocks),
+        )
+        head_blocks = self.blocks[:first_caption_index]
+        remaining_head_blocks = [block for block in head_blocks if not isinstance(block, (Comment, Style, Region))]
+
+        # Blocks are replaced at once, instead of being removed while iterating over them (which skips blocks)
+        if len(remaining_head_blocks) != len(head_blocks):
+            self.blocks[:first_caption_index] = remaining_head_blocks
+            self._modified = True
 
 
 # --- Constants ---
@@ -8,7 +8,7 @@ import re
 import secrets
 import shutil
 import sys
-from typing import TYPE_CHECKING, Any, Type, Union, get_args, get_origin
+from typing import TYPE_CHECKING, Any, Mapping, Type, Union, get_args, get_origin
 
 from isubrip.constants import TEMP_FOLDER_PATH, TITLE_REPLACEMENT_STRINGS, WINDOWS_RESERVED_FILE_NAMES
 from isubrip.data_structures import (
@@ -403,7 +403,7 @@ def generate_non_conflicting_path(file_path: Path, has_extension: bool = True) -
         i += 1
 
 
-def merge_dict_values(*dictionaries: dict) -> dict:
+def merge_dict_values(*dictionaries: Mapping) -> Mapping:
     """
     A function for merging the values of multiple dictionaries using the same keys.
     If a key already exists, the value will be added to a list of values mapped to that key.
@@ -412,10 +412,10 @@ def merge_dict_values(*dictionaries: dict) -> dict:
         This function support only merging of lists, without any nesting.
 
     Args:
-        *dictionaries (dict): Dictionaries to merge.
+        *dictionaries (Mapping): Dictionaries (or other mappings) to merge.
 
     Returns:
-        dict: A merged dictionary.
+        Mapping: A merged dictionary, or the original mapping if only one non-empty mapping was passed.
     """
     _dictionaries = [d for d in dictionaries if d]
 
@@ -441,7 +441,8 @@ def merge_dict_values(*dictionaries: dict) -> dict:
                     else:
                         result[key] = [result[key], value]
             else:
-                result[key] = value
+                # Copy lists, to avoid modifying the original dictionaries when extending them
+                result[key] = value.copy() if isinstance(value, list) else value
 
     return result
 
@@ -496,6 +497,26 @@ def parse_url_params(url_params: str) -> dict:
     return {key: value for key, value in (param.split('=') for param in params_list)}
 
 
+def parse_subtitles_time(time_str: str) -> dt.time:
+    """
+    Parse a subtitles time string to a time object.
+
+    Args:
+        time_str (str): A subtitles time string, in an "[HH:]MM:SS.mmm" format. For example: "00:01:02.345"
+            ',' can be used as the milliseconds separator as well (used in SubRip format).
+
+    Returns:
+        time: A time object representing the time string.
+    """
+    # Fields have a fixed width, so they're sliced directly (from the end, as hours are optional)
+    return dt.time(
+        hour=int(time_str[:-10]) if len(time_str) > 9 else 0,
+        minute=int(time_str[-9:-7]),
+        second=int(time_str[-6:-4]),
+        microsecond=int(time_str[-3:]) * 1000,
+    )
+
+
 def single_to_list(obj: Any) -> list:
     """
     Convert a single non-iterable object to a list.
@@ -531,11 +552,8 @@ def split_subtitles_timestamp(timestamp: str) -> tuple[dt.time, dt.time]:
     Returns:
         tuple(time, time): A tuple containing start and end times as a datetime object.
     """
-    # Support ',' character in timestamp's milliseconds (used in SubRip format).
-    timestamp = timestamp.replace(',', '.')
-
-    start_time, end_time = timestamp.split(" --> ")
-    return dt.time.fromisoformat(start_time), dt.time.fromisoformat(end_time)
+    start_time, end_time = timestamp.split("-->")
+    return parse_subtitles_time(start_time.strip()), parse_subtitles_time(end_time.strip())
 
 
 @lru_cache